@@ -0,0 +1,42 @@
+"""
+Bundle the third-party settings modules into a single importable file.
+
+Writes config/settings/_compiled.py by concatenating every module listed in
+config.settings.SETTINGS_MODULES. config.django.base imports the bundle when
+it exists, so each worker loads one module instead of eleven. Values are
+still read from the environment at import time; only the source is
+bundled.
+
+Run at image build time (see dockerfiles/production/Dockerfile). The output
+is gitignored; delete it or re-run the command after editing any settings
+module.
+"""
+
+from django.core.management.base import BaseCommand
+
+from config.env import BASE_DIR
+from config.settings import SETTINGS_MODULES
+
+SETTINGS_DIR = BASE_DIR / "config" / "settings"
+COMPILED_PATH = SETTINGS_DIR / "_compiled.py"
+
+HEADER = '''"""
+Generated by `manage.py build_settings` - do not edit.
+
+Concatenation of config.settings.{modules}.
+"""
+'''
+
+
+class Command(BaseCommand):
+    help = "Bundle config/settings/* into config/settings/_compiled.py."
+
+    def handle(self, *args, **options) -> None:
+        parts = [HEADER.format(modules=", ".join(SETTINGS_MODULES))]
+
+        for name in SETTINGS_MODULES:
+            source = (SETTINGS_DIR / f"{name}.py").read_text()
+            parts.append(f"\n# --- config/settings/{name}.py ---\n{source}")
+
+        COMPILED_PATH.write_text("".join(parts))
+        self.stdout.write(self.style.SUCCESS(f"Wrote {COMPILED_PATH}"))
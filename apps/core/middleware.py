@@ -0,0 +1,24 @@
+"""
+Core Middleware - Request-scoped infrastructure shared by all apps.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from django.http import HttpRequest, HttpResponse
+
+from .request_cache import request_cache_scope
+
+
+class RequestCacheMiddleware:
+    """
+    Provide a fresh request cache (see apps.core.request_cache) per request.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        with request_cache_scope():
+            return self.get_response(request)
@@ -0,0 +1,17 @@
+"""
+Core Pagination - Shared DRF pagination classes.
+"""
+
+from rest_framework.pagination import CursorPagination
+
+
+class DefaultCursorPagination(CursorPagination):
+    """
+    Cursor pagination ordered by primary key.
+
+    Avoids the COUNT(*) query of page-number pagination and keeps each
+    page a bounded LIMIT query regardless of table size.
+    """
+
+    page_size = 50
+    ordering = "id"
@@ -0,0 +1,43 @@
+"""
+Core Renderers - Fast JSON rendering for DRF responses.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class OrjsonRenderer(BaseRenderer):
+    """
+    Render responses to JSON with orjson.
+
+    Output matches DRF's JSONRenderer: UTC datetimes end in "Z", and types
+    orjson cannot encode natively (Decimal, lazy translation strings,
+    QuerySets, ...) fall back to DRF's JSONEncoder.
+    """
+
+    media_type = "application/json"
+    format = "json"
+    charset = None
+
+    _fallback = JSONEncoder()
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: str | None = None,
+        renderer_context: Mapping[str, Any] | None = None,
+    ) -> bytes:
+        if data is None:
+            return b""
+
+        return orjson.dumps(
+            data,
+            default=self._fallback.default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z,
+        )
@@ -0,0 +1,49 @@
+"""
+Request Cache - Per-request memoization for selectors.
+
+The cache lives in a ContextVar that RequestCacheMiddleware opens for the
+duration of each request, so cached objects never leak across requests.
+Outside a request (services called from tasks, shell, tests) there is no
+active cache and lookups go straight to the database.
+
+Usage:
+    from apps.core.request_cache import get_request_cache
+
+    cache = get_request_cache()
+    if cache is not None:
+        ...
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+_request_cache: ContextVar[dict[Any, Any] | None] = ContextVar(
+    "request_cache", default=None
+)
+
+
+def get_request_cache() -> dict[Any, Any] | None:
+    """
+    Return the cache for the current request.
+
+    Returns:
+        The request-scoped dict, or None when no request is active
+    """
+    return _request_cache.get()
+
+
+@contextmanager
+def request_cache_scope() -> Iterator[dict[Any, Any]]:
+    """
+    Open a fresh request cache, discarding it on exit.
+    """
+    cache: dict[Any, Any] = {}
+    token = _request_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _request_cache.reset(token)
@@ -0,0 +1,47 @@
+"""
+Core Serializers - Shared DRF serializer helpers.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Any, ClassVar
+
+from rest_framework import serializers
+
+
+class CachedFieldsMixin:
+    """
+    Build a serializer's field map once per class.
+
+    ModelSerializer.get_fields() introspects the model and constructs every
+    field on each instantiation; plain Serializers deep-copy their declared
+    fields. This mixin keeps the first (unbound) result per class and hands
+    each instance copies, which are then bound as usual.
+
+    Flat fields are shallow-copied. Nested serializers (including
+    many=True ListSerializers) are deep-copied, since they own child
+    fields that are bound to their parent and must not be shared across
+    instances.
+
+    Usage:
+        class UserOutputSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+            ...
+    """
+
+    _fields_cache: ClassVar[dict[type, dict[str, serializers.Field]]] = {}
+
+    def get_fields(self) -> dict[str, Any]:
+        cls = type(self)
+        cached = CachedFieldsMixin._fields_cache.get(cls)
+        if cached is None:
+            cached = super().get_fields()  # type: ignore[misc]
+            CachedFieldsMixin._fields_cache[cls] = cached
+        return {name: _copy_field(field) for name, field in cached.items()}
+
+
+def _copy_field(field: serializers.Field) -> serializers.Field:
+    """Copy a cached field; nested serializers get fresh child fields."""
+    if isinstance(field, serializers.BaseSerializer):
+        return copy.deepcopy(field)
+    return copy.copy(field)
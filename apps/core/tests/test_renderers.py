@@ -0,0 +1,32 @@
+"""
+Tests for core renderers.
+"""
+
+import datetime
+from decimal import Decimal
+
+from django.utils.translation import gettext_lazy
+
+from apps.core.renderers import OrjsonRenderer
+
+
+class TestOrjsonRenderer:
+    """Tests for OrjsonRenderer."""
+
+    def test_renders_utc_datetime_with_z_suffix(self):
+        """Should format UTC datetimes like DRF's JSONRenderer."""
+        value = datetime.datetime(2026, 1, 15, 10, 30, tzinfo=datetime.UTC)
+
+        rendered = OrjsonRenderer().render({"at": value})
+
+        assert rendered == b'{"at":"2026-01-15T10:30:00Z"}'
+
+    def test_falls_back_for_unsupported_types(self):
+        """Should encode Decimal and lazy strings via DRF's encoder."""
+        data = {"amount": Decimal("1.5"), "msg": gettext_lazy("hello")}
+
+        assert OrjsonRenderer().render(data) == b'{"amount":1.5,"msg":"hello"}'
+
+    def test_renders_none_as_empty_body(self):
+        """Should return an empty body for no data."""
+        assert OrjsonRenderer().render(None) == b""
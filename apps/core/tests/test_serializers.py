@@ -0,0 +1,67 @@
+"""
+Tests for core serializer helpers.
+"""
+
+from rest_framework import serializers
+
+from apps.core.serializers import CachedFieldsMixin
+
+
+class ItemSerializer(serializers.Serializer):
+    name = serializers.CharField()
+
+
+class OrderSerializer(CachedFieldsMixin, serializers.Serializer):
+    reference = serializers.CharField()
+    items = ItemSerializer(many=True)
+
+
+class TestCachedFieldsMixin:
+    """Tests for CachedFieldsMixin."""
+
+    def test_builds_fields_once_per_class(self, monkeypatch):
+        """Should call the parent get_fields() only for the first instance."""
+        calls = []
+        original = serializers.Serializer.get_fields
+
+        def counting_get_fields(self):
+            calls.append(type(self))
+            return original(self)
+
+        monkeypatch.setattr(CachedFieldsMixin, "_fields_cache", {})
+        monkeypatch.setattr(serializers.Serializer, "get_fields", counting_get_fields)
+
+        OrderSerializer().get_fields()
+        OrderSerializer().get_fields()
+
+        assert calls.count(OrderSerializer) == 1
+
+    def test_instances_get_their_own_bound_fields(self):
+        """Should bind a separate copy of each field to every instance."""
+        first, second = OrderSerializer(), OrderSerializer()
+
+        assert first.fields["reference"] is not second.fields["reference"]
+        assert first.fields["reference"].parent is first
+        assert second.fields["reference"].parent is second
+
+    def test_nested_serializers_are_not_shared(self):
+        """Should give each instance its own nested child bound to it."""
+        first = OrderSerializer(context={"request": "first"})
+        second = OrderSerializer(context={"request": "second"})
+
+        first_items, second_items = first.fields["items"], second.fields["items"]
+        assert isinstance(first_items, serializers.ListSerializer)
+        assert isinstance(second_items, serializers.ListSerializer)
+        first_child, second_child = first_items.child, second_items.child
+        assert first_child is not None and second_child is not None
+
+        assert first_child is not second_child
+        assert first_child.parent is first_items
+        assert first_child.context == {"request": "first"}
+        assert second_child.context == {"request": "second"}
+
+    def test_serializes_nested_data(self):
+        """Should produce the same output as an uncached serializer."""
+        data = {"reference": "A-1", "items": [{"name": "x"}, {"name": "y"}]}
+
+        assert OrderSerializer(data).data == data
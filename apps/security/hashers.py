@@ -0,0 +1,21 @@
+"""
+Password Hashers - Tuned hashing parameters.
+"""
+
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id with the OWASP interactive-login profile (46 MiB, t=1, p=1).
+
+    Keeps verification well under the 500ms interactive budget. Heavier
+    profiles such as RFC 9106's 2 GiB add little protection for a much
+    larger memory cost per login. Shares the "argon2" algorithm name, so
+    hashes made with other parameters still verify and are upgraded to
+    these on the next successful login.
+    """
+
+    memory_cost = 46 * 1024  # KiB
+    time_cost = 1
+    parallelism = 1
@@ -32,32 +32,44 @@ class SecurityHeadersMiddleware:
     def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
         self.get_response = get_response
 
-    def __call__(self, request: HttpRequest) -> HttpResponse:
-        response = self.get_response(request)
+        # Settings are fixed for the life of the process (middleware is built
+        # once per handler), so the header values are resolved here once
+        self.enabled = getattr(settings, "SECURITY_HEADERS_ENABLED", True)
+
+        headers = {
+            "X-Content-Type-Options": "nosniff",
+            "X-Frame-Options": "DENY",
+            "Referrer-Policy": "strict-origin-when-cross-origin",
+            "Permissions-Policy": (
+                "accelerometer=(), camera=(), geolocation=(), gyroscope=(), "
+                "magnetometer=(), microphone=(), payment=(), usb=()"
+            ),
+        }
 
-        if not getattr(settings, "SECURITY_HEADERS_ENABLED", True):
-            return response
+        csp = getattr(settings, "SECURITY_CSP_POLICY", None)
+        if csp:
+            headers["Content-Security-Policy"] = csp
 
-        response["X-Content-Type-Options"] = "nosniff"
+        self.headers = tuple(headers.items())
 
-        response["X-Frame-Options"] = "DENY"
+        hsts_seconds = getattr(settings, "SECURITY_HSTS_SECONDS", 0)
+        self.hsts_header = (
+            f"max-age={hsts_seconds}; includeSubDomains; preload"
+            if hsts_seconds > 0
+            else None
+        )
 
-        response["Referrer-Policy"] = "strict-origin-when-cross-origin"
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        response = self.get_response(request)
 
-        response["Permissions-Policy"] = (
-            "accelerometer=(), camera=(), geolocation=(), gyroscope=(), "
-            "magnetometer=(), microphone=(), payment=(), usb=()"
-        )
+        if not self.enabled:
+            return response
 
-        csp = getattr(settings, "SECURITY_CSP_POLICY", None)
-        if csp:
-            response["Content-Security-Policy"] = csp
+        for name, value in self.headers:
+            response[name] = value
 
-        hsts_seconds = getattr(settings, "SECURITY_HSTS_SECONDS", 0)
-        if hsts_seconds > 0 and request.is_secure():
-            response["Strict-Transport-Security"] = (
-                f"max-age={hsts_seconds}; includeSubDomains; preload"
-            )
+        if self.hsts_header and request.is_secure():
+            response["Strict-Transport-Security"] = self.hsts_header
 
         return response
 
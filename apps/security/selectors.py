@@ -4,8 +4,18 @@ Security Selectors - Read operations for security domain.
 
 from __future__ import annotations
 
+from dataclasses import dataclass, fields
+from datetime import datetime
+
 from django.contrib.sessions.models import Session
-from django.db.models import QuerySet
+from django.db.models import (
+    BooleanField,
+    Expression,
+    ExpressionWrapper,
+    Q,
+    QuerySet,
+    Value,
+)
 from django.utils import timezone
 
 from apps.users.models import User
@@ -13,15 +23,36 @@ from apps.users.models import User
 from .models import AdminIPAllowlist, UserSession
 
 
+@dataclass(slots=True, frozen=True)
+class SessionRow:
+    """Lightweight read-only view of a session for API listings."""
+
+    session_key: str
+    device_info: str
+    ip_address: str | None
+    last_activity: datetime
+    created_at: datetime
+    is_current: bool
+
+
+SESSION_ROW_FIELDS = tuple(field.name for field in fields(SessionRow))
+
+
 def session_list_for_user(
-    *, user: User, active_only: bool = True
+    *,
+    user: User,
+    active_only: bool = True,
+    current_session_key: str | None = None,
 ) -> QuerySet[UserSession]:
     """
     Get all sessions for a user.
 
+    Each session is annotated with ``is_current``, computed by the database.
+
     Args:
         user: The user to get sessions for
         active_only: Whether to filter to active sessions only
+        current_session_key: The current request's session key (optional)
 
     Returns:
         QuerySet of UserSession objects
@@ -29,7 +60,42 @@ def session_list_for_user(
     qs = UserSession.objects.filter(user=user)
     if active_only:
         qs = qs.filter(is_active=True)
-    return qs.order_by("-last_activity")
+
+    is_current: Expression
+    if current_session_key:
+        is_current = ExpressionWrapper(
+            Q(session_key=current_session_key),
+            output_field=BooleanField(),
+        )
+    else:
+        is_current = Value(False, output_field=BooleanField())
+
+    return qs.annotate(is_current=is_current).order_by("-last_activity")
+
+
+def session_rows_for_user(
+    *,
+    user: User,
+    current_session_key: str | None = None,
+) -> list[SessionRow]:
+    """
+    Get a user's active sessions as SessionRow objects.
+
+    Fetches plain tuples instead of model instances.
+
+    Args:
+        user: The user to get sessions for
+        current_session_key: The current request's session key (optional)
+
+    Returns:
+        List of SessionRow objects, most recently active first
+    """
+    rows = session_list_for_user(
+        user=user,
+        active_only=True,
+        current_session_key=current_session_key,
+    ).values_list(*SESSION_ROW_FIELDS)
+    return [SessionRow(*row) for row in rows]
 
 
 def session_get_by_key(*, session_key: str) -> UserSession | None:
@@ -65,6 +65,21 @@ class TestSecurityHeadersMiddleware:
 
         assert response["Content-Security-Policy"] == "default-src 'self'"
 
+    @override_settings(SECURITY_HSTS_SECONDS=3600)
+    def test_adds_hsts_header_only_for_secure_requests(
+        self, request_factory, get_response
+    ):
+        """Should add HSTS header to HTTPS responses only."""
+        middleware = SecurityHeadersMiddleware(get_response)
+
+        secure = middleware(request_factory.get("/", secure=True))
+        insecure = middleware(request_factory.get("/"))
+
+        assert secure["Strict-Transport-Security"] == (
+            "max-age=3600; includeSubDomains; preload"
+        )
+        assert "Strict-Transport-Security" not in insecure
+
 
 class TestAdminIPRestrictionMiddleware:
     """Tests for AdminIPRestrictionMiddleware."""
@@ -42,6 +42,32 @@ class TestSessionListForUser:
 
         assert sessions.count() == 2
 
+    def test_annotates_current_session(self, user, db):
+        """Should flag only the session matching current_session_key."""
+        UserSession.objects.create(user=user, session_key="current")
+        UserSession.objects.create(user=user, session_key="other")
+
+        rows = selectors.session_rows_for_user(user=user, current_session_key="current")
+
+        flags = {row.session_key: row.is_current for row in rows}
+        assert flags == {"current": True, "other": False}
+
+
+class TestSessionRowsForUser:
+    """Tests for session_rows_for_user selector."""
+
+    def test_returns_rows_for_active_sessions(self, user, db):
+        """Should build SessionRow objects for active sessions only."""
+        UserSession.objects.create(user=user, session_key="current", is_active=True)
+        UserSession.objects.create(user=user, session_key="gone", is_active=False)
+
+        rows = selectors.session_rows_for_user(user=user, current_session_key="current")
+
+        assert len(rows) == 1
+        assert isinstance(rows[0], selectors.SessionRow)
+        assert rows[0].session_key == "current"
+        assert rows[0].is_current is True
+
 
 class TestSessionGetByKey:
     """Tests for session_get_by_key selector."""
@@ -2,10 +2,21 @@
 Tests for security validators.
 """
 
+import asyncio
+import hashlib
+import io
+from unittest import mock
+
 import pytest
 from django.core.exceptions import ValidationError
 
-from apps.security.validators import BreachCheckValidator, PasswordStrengthValidator
+from apps.security.validators import (
+    BloomCommonPasswordValidator,
+    BloomFilter,
+    BreachCheckValidator,
+    PasswordStrengthValidator,
+    _fetch_hibp_range,
+)
 
 
 class TestPasswordStrengthValidator:
@@ -23,6 +34,15 @@ class TestPasswordStrengthValidator:
         with pytest.raises(ValidationError):
             validator.validate("Short1!")
 
+    def test_short_password_reports_only_length_error(self):
+        """Should stop at the length check for too-short passwords."""
+        validator = PasswordStrengthValidator(min_length=10)
+        with pytest.raises(ValidationError) as exc_info:
+            validator.validate("short")
+
+        assert len(exc_info.value.messages) == 1
+        assert "at least 10" in exc_info.value.messages[0]
+
     def test_rejects_password_without_uppercase(self):
         """Should reject password without uppercase."""
         validator = PasswordStrengthValidator(require_uppercase=True)
@@ -68,3 +88,58 @@ class TestBreachCheckValidator:
         validator = BreachCheckValidator()
         help_text = validator.get_help_text()
         assert "breach" in help_text.lower()
+
+    def test_check_password_parses_range_response(self):
+        """Should return the breach count for the matching hash suffix."""
+        suffix = hashlib.sha1(b"password123").hexdigest().upper()[5:]
+        body = f"0000000000000000000000000000000000A:3\r\n{suffix}:42\r\n".encode()
+
+        _fetch_hibp_range.cache_clear()
+        with mock.patch("urllib.request.urlopen", return_value=io.BytesIO(body)):
+            assert BreachCheckValidator()._check_password("password123") == 42
+
+    def test_check_password_caches_range_by_prefix(self):
+        """Should reuse the cached range response for a repeated prefix."""
+        _fetch_hibp_range.cache_clear()
+        with mock.patch(
+            "urllib.request.urlopen", return_value=io.BytesIO(b"")
+        ) as urlopen:
+            validator = BreachCheckValidator()
+            validator._check_password("password123")
+            validator._check_password("password123")
+
+        assert urlopen.call_count == 1
+
+    def test_avalidate_rejects_breached_password(self):
+        """Should reject breached passwords from the async path."""
+        validator = BreachCheckValidator(enabled=True)
+
+        with (
+            mock.patch.object(validator, "_check_password", return_value=5),
+            pytest.raises(ValidationError),
+        ):
+            asyncio.run(validator.avalidate("password123"))
+
+
+class TestBloomCommonPasswordValidator:
+    """Tests for BloomCommonPasswordValidator."""
+
+    def test_filter_has_no_false_negatives(self):
+        """Should report every added item as present."""
+        bloom = BloomFilter(capacity=1000)
+        items = [f"password{i}" for i in range(1000)]
+        for item in items:
+            bloom.add(item)
+
+        assert all(item in bloom for item in items)
+
+    def test_rejects_common_password(self):
+        """Should reject a password from Django's common list."""
+        validator = BloomCommonPasswordValidator()
+        with pytest.raises(ValidationError):
+            validator.validate("password")
+
+    def test_accepts_uncommon_password(self):
+        """Should accept a password not in the list."""
+        validator = BloomCommonPasswordValidator()
+        validator.validate("Zq8!vLr2#pXw9$Tm")
@@ -6,18 +6,46 @@ Custom validators for password strength and breach checking.
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import gzip
 import hashlib
 import logging
 import math
 import string
+import urllib.request
+from collections.abc import Iterator
+from pathlib import Path
 from typing import Any
 
 from django.conf import settings
+from django.contrib.auth.password_validation import CommonPasswordValidator
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext as _
 
 logger = logging.getLogger(__name__)
 
+HIBP_RANGE_URL = "https://api.pwnedpasswords.com/range/{prefix}"
+
+# Each cached range body is ~30 KB, so 256 entries cap the cache near 8 MB
+HIBP_RANGE_CACHE_SIZE = 256
+
+
+@functools.lru_cache(maxsize=HIBP_RANGE_CACHE_SIZE)
+def _fetch_hibp_range(prefix: str) -> bytes:
+    """
+    Fetch the HIBP range body for a 5-char SHA-1 prefix.
+
+    Responses are cached per process, so validations sharing a prefix reuse
+    one network round trip. Failed requests raise and are not cached.
+    """
+    req = urllib.request.Request(
+        HIBP_RANGE_URL.format(prefix=prefix),
+        headers={"User-Agent": "Django-Velocity-PasswordCheck"},
+    )
+    with urllib.request.urlopen(req, timeout=5) as response:
+        return response.read()
+
 
 class PasswordStrengthValidator:
     """
@@ -44,14 +72,17 @@ class PasswordStrengthValidator:
 
     def validate(self, password: str, user: Any = None) -> None:
         """Validate the password meets strength requirements."""
-        errors = []
-
+        # Too-short passwords fail fast, skipping the character-class scans
         if len(password) < self.min_length:
-            errors.append(
-                _("Password must be at least %(min_length)d characters long.")
-                % {"min_length": self.min_length}
+            raise ValidationError(
+                [
+                    _("Password must be at least %(min_length)d characters long.")
+                    % {"min_length": self.min_length}
+                ]
             )
 
+        errors = []
+
         if self.require_uppercase and not any(c.isupper() for c in password):
             errors.append(_("Password must contain at least one uppercase letter."))
 
@@ -142,22 +173,43 @@ class BreachCheckValidator:
             return
 
         try:
-            breach_count = self._check_password(password)
-            threshold = getattr(settings, "PASSWORD_BREACH_THRESHOLD", self.threshold)
-
-            if breach_count >= threshold:
-                raise ValidationError(
-                    _(
-                        "This password has been exposed in a data breach "
-                        "and should not be used. Please choose a different password."
-                    ),
-                    code="password_breached",
-                )
+            self._raise_if_breached(self._check_password(password))
         except ValidationError:
             raise
         except Exception as e:
             logger.warning(f"Breach check failed: {e}")
 
+    async def avalidate(self, password: str, user: Any = None) -> None:
+        """
+        Async variant of validate() for ASGI callers.
+
+        Runs the blocking HIBP request in a worker thread so the event loop
+        keeps serving other requests during the round trip.
+        """
+        if not self.enabled:
+            return
+
+        try:
+            breach_count = await asyncio.to_thread(self._check_password, password)
+            self._raise_if_breached(breach_count)
+        except ValidationError:
+            raise
+        except Exception as e:
+            logger.warning(f"Breach check failed: {e}")
+
+    def _raise_if_breached(self, breach_count: int) -> None:
+        """Raise ValidationError if breach_count reaches the threshold."""
+        threshold = getattr(settings, "PASSWORD_BREACH_THRESHOLD", self.threshold)
+
+        if breach_count >= threshold:
+            raise ValidationError(
+                _(
+                    "This password has been exposed in a data breach "
+                    "and should not be used. Please choose a different password."
+                ),
+                code="password_breached",
+            )
+
     def _check_password(self, password: str) -> int:
         """
         Check password against Have I Been Pwned API.
@@ -167,24 +219,16 @@ class BreachCheckValidator:
         Returns:
             Number of times password appears in breaches
         """
-        import urllib.request
-
         sha1_hash = hashlib.sha1(password.encode("utf-8")).hexdigest().upper()
         prefix = sha1_hash[:5]
-        suffix = sha1_hash[5:]
-
-        url = f"https://api.pwnedpasswords.com/range/{prefix}"
+        suffix = sha1_hash[5:].encode("ascii")
 
         try:
-            req = urllib.request.Request(
-                url,
-                headers={"User-Agent": "Django-Velocity-PasswordCheck"},
-            )
-            with urllib.request.urlopen(req, timeout=5) as response:
-                body = response.read().decode("utf-8")
+            # The range body is ASCII; match on bytes to skip a decode pass
+            body = _fetch_hibp_range(prefix)
 
             for line in body.splitlines():
-                hash_suffix, count = line.split(":")
+                hash_suffix, count = line.split(b":")
                 if hash_suffix == suffix:
                     return int(count)
 
@@ -197,3 +241,74 @@ class BreachCheckValidator:
     def get_help_text(self) -> str:
         """Return help text for this validator."""
         return _("Your password must not have been exposed in a known data breach.")
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings.
+
+    Membership tests never give false negatives; false positives occur at
+    roughly ``error_rate`` once ``capacity`` items have been added.
+    """
+
+    __slots__ = ("_bits", "_hash_count", "_size")
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        capacity = max(capacity, 1)
+        self._size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self._hash_count = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+
+    def _positions(self, item: str) -> Iterator[int]:
+        """Derive bit positions via double hashing of one BLAKE2b digest."""
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self._size for i in range(self._hash_count))
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: object) -> bool:
+        if not isinstance(item, str):
+            return False
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item)
+        )
+
+
+class BloomCommonPasswordValidator(CommonPasswordValidator):
+    """
+    CommonPasswordValidator backed by a Bloom filter instead of a set.
+
+    Django's ~20k-entry list costs about 2 MB per worker as a set of
+    strings; the filter needs ~36 KB. At the default error rate about 1 in
+    1000 uncommon passwords is wrongly rejected as common.
+
+    Configurable via OPTIONS:
+    - password_list_path: path to a (gzipped) password list
+    - error_rate: target false-positive rate (default 0.001)
+    """
+
+    def __init__(
+        self,
+        password_list_path: str | Path | None = None,
+        error_rate: float = 0.001,
+    ) -> None:
+        if password_list_path is None:
+            password_list_path = self.DEFAULT_PASSWORD_LIST_PATH
+
+        try:
+            with gzip.open(password_list_path, "rt", encoding="utf-8") as f:
+                common = [line.strip() for line in f]
+        except OSError:
+            with Path(password_list_path).open(encoding="utf-8") as f:
+                common = [line.strip() for line in f]
+
+        # validate() only needs `password in self.passwords`
+        self.passwords = BloomFilter(  # type: ignore[assignment]
+            capacity=len(common), error_rate=error_rate
+        )
+        for password in common:
+            self.passwords.add(password)
@@ -30,20 +30,10 @@ class SessionListApi(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request: Request) -> Response:
-        sessions = selectors.session_list_for_user(user=request.user, active_only=True)
-
-        data = []
-        for session in sessions:
-            data.append(
-                {
-                    "session_key": session.session_key,
-                    "device_info": session.device_info,
-                    "ip_address": session.ip_address,
-                    "last_activity": session.last_activity,
-                    "created_at": session.created_at,
-                    "is_current": session.session_key == request.session.session_key,
-                }
-            )
+        data = selectors.session_rows_for_user(
+            user=request.user,
+            current_session_key=request.session.session_key,
+        )
 
         serializer = SessionOutputSerializer(data, many=True)
         return Response(serializer.data)
@@ -0,0 +1,41 @@
+"""
+User Cache - Cached read models for the User domain.
+
+The active-user list is cached per page under a generation token. Any
+write to a User replaces the token (see signals.py), which orphans every
+cached page at once without needing pattern deletes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+
+from django.core.cache import cache
+
+USER_LIST_CACHE_PREFIX = "users:list_active:v1"
+USER_LIST_CACHE_TIMEOUT = 300  # seconds
+
+_GENERATION_KEY = f"{USER_LIST_CACHE_PREFIX}:generation"
+
+
+def user_list_cache_key(*, url: str) -> str:
+    """
+    Build the cache key for one page of the active-user list.
+
+    Args:
+        url: The absolute request URL (includes the pagination cursor)
+
+    Returns:
+        Cache key scoped to the current generation
+    """
+    # A fresh token is minted if the generation key was evicted, so pages
+    # cached under an older generation can never be served again.
+    generation = cache.get_or_set(_GENERATION_KEY, time.time_ns, timeout=None)
+    url_hash = hashlib.md5(url.encode("utf-8"), usedforsecurity=False).hexdigest()
+    return f"{USER_LIST_CACHE_PREFIX}:{generation}:{url_hash}"
+
+
+def user_list_cache_invalidate() -> None:
+    """Invalidate every cached page of the active-user list."""
+    cache.set(_GENERATION_KEY, time.time_ns(), timeout=None)
@@ -0,0 +1,61 @@
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def backfill_email_normalized(apps, schema_editor):
+    User = apps.get_model("users", "User")
+
+    # email was unique case-sensitively, so rows may differ only by case.
+    # They would violate the unique constraint added below; fail with the
+    # offending addresses so they can be merged or renamed by hand first.
+    duplicates = list(
+        User.objects.values(normalized=Lower("email"))
+        .annotate(count=Count("pk"))
+        .filter(count__gt=1)
+        .values_list("normalized", flat=True)
+        .order_by("normalized")
+    )
+    if duplicates:
+        raise RuntimeError(
+            "Cannot make email_normalized unique; these emails belong to more "
+            "than one user when compared case-insensitively: "
+            + ", ".join(duplicates)
+            + ". Merge or rename the duplicate accounts, then re-run migrate."
+        )
+
+    User.objects.update(email_normalized=Lower("email"))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("users", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="email_normalized",
+            field=models.EmailField(
+                editable=False,
+                max_length=254,
+                null=True,
+                verbose_name="normalized email address",
+            ),
+        ),
+        migrations.RunPython(
+            backfill_email_normalized,
+            reverse_code=migrations.RunPython.noop,
+        ),
+        migrations.AlterField(
+            model_name="user",
+            name="email_normalized",
+            field=models.EmailField(
+                db_index=True,
+                editable=False,
+                max_length=254,
+                unique=True,
+                verbose_name="normalized email address",
+            ),
+        ),
+    ]
@@ -0,0 +1,41 @@
+"""
+Trigram GIN indexes backing the admin user search.
+
+Django admin searches with ``icontains``, which PostgreSQL renders as
+``UPPER("col"::text) LIKE UPPER('%term%')``. The indexes are built on that
+exact expression so the planner can use them. They are PostgreSQL-only and
+skipped on other backends (e.g. the SQLite test database).
+"""
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+SEARCH_FIELDS = ["email", "first_name", "last_name"]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for field in SEARCH_FIELDS:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS users_{field}_trgm "
+            f'ON users_user USING gin (UPPER("{field}"::text) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for field in SEARCH_FIELDS:
+        schema_editor.execute(f"DROP INDEX IF EXISTS users_{field}_trgm")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("users", "0002_user_email_normalized"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -5,8 +5,12 @@ This module defines the custom User model that should be used
 throughout the application instead of Django's default User.
 """
 
+from collections.abc import Collection
+
 from django.contrib.auth.models import AbstractUser, BaseUserManager
+from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.functions import Upper
 
 from apps.core.models import BaseModel
 
@@ -81,6 +85,14 @@ class User(AbstractUser, BaseModel):
         },
     )
 
+    # Lowercased copy of email for index-backed case-insensitive lookups
+    email_normalized = models.EmailField(
+        "normalized email address",
+        unique=True,
+        db_index=True,
+        editable=False,
+    )
+
     # Optional profile fields
     first_name = models.CharField("first name", max_length=150, blank=True)
     last_name = models.CharField("last name", max_length=150, blank=True)
@@ -96,10 +108,47 @@ class User(AbstractUser, BaseModel):
         verbose_name = "user"
         verbose_name_plural = "users"
         ordering = ["-created_at"]
+        indexes = [
+            # Backs email__iexact lookups (e.g. from allauth), which PostgreSQL
+            # compiles to UPPER("email") = UPPER(%s)
+            models.Index(Upper("email"), name="users_email_upper_idx"),
+        ]
 
     def __str__(self) -> str:
         return self.email
 
+    def save(self, *args, **kwargs) -> None:
+        """Keep email_normalized in sync with email on every save."""
+        self.email_normalized = self.email.lower()
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "email" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "email_normalized"}
+
+        super().save(*args, **kwargs)
+
+    def validate_unique(self, exclude: Collection[str] | None = None) -> None:
+        """
+        Reject emails that differ from an existing one only by case.
+
+        email_normalized is not editable, so Django skips its unique check
+        and a case variant would otherwise surface as an IntegrityError
+        instead of a form error on email.
+        """
+        super().validate_unique(exclude=exclude)
+
+        if exclude and "email" in exclude:
+            return
+
+        duplicates = User.objects.filter(email_normalized=self.email.lower())
+        if not self._state.adding:
+            duplicates = duplicates.exclude(pk=self.pk)
+
+        if duplicates.exists():
+            raise ValidationError(
+                {"email": [self.unique_error_message(User, ("email",))]}
+            )
+
     @property
     def full_name(self) -> str:
         """Return the user's full name."""
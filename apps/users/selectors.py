@@ -11,10 +11,28 @@ IMPORTANT: Selectors should NEVER modify data.
 
 from __future__ import annotations
 
-from django.db.models import QuerySet
+from typing import Any
+
+from django.db.models import CharField, QuerySet, Value
+from django.db.models.functions import Coalesce, Concat, NullIf, Trim
+
+from apps.core.request_cache import get_request_cache
 
 from .models import User
 
+# Keys of the rows returned by user_list_active_values(), matching the
+# UserOutputSerializer output
+USER_OUTPUT_FIELDS = (
+    "id",
+    "email",
+    "first_name",
+    "last_name",
+    "full_name",
+    "is_active",
+    "created_at",
+    "updated_at",
+)
+
 
 def user_get_by_id(*, user_id: int) -> User | None:
     """
@@ -33,13 +51,27 @@ def user_get_by_email(*, email: str) -> User | None:
     """
     Get a user by their email address.
 
+    Found users are memoized for the rest of the current request.
+
     Args:
         email: The user's email address
 
     Returns:
         User instance or None if not found
     """
-    return User.objects.filter(email__iexact=email).first()
+    email_normalized = email.lower()
+    cache = get_request_cache()
+    cache_key = ("user_get_by_email", email_normalized)
+
+    if cache is not None and cache_key in cache:
+        return cache[cache_key]
+
+    user = User.objects.filter(email_normalized=email_normalized).first()
+
+    if cache is not None and user is not None:
+        cache[cache_key] = user
+
+    return user
 
 
 def user_list(
@@ -78,6 +110,29 @@ def user_list_active() -> QuerySet[User]:
     return user_list(is_active=True)
 
 
+def user_list_active_values() -> QuerySet[User, dict[str, Any]]:
+    """
+    Get all active users as plain dicts shaped like UserOutputSerializer.
+
+    Skips model instantiation entirely; full_name is computed in SQL with
+    the same fallback to email as User.full_name.
+
+    Returns:
+        QuerySet of dicts keyed by USER_OUTPUT_FIELDS
+    """
+    full_name = Coalesce(
+        NullIf(Trim(Concat("first_name", Value(" "), "last_name")), Value("")),
+        "email",
+        output_field=CharField(),
+    )
+    return (
+        user_list(is_active=True)
+        # Shadows the User.full_name property, which django-stubs reports
+        .annotate(full_name=full_name)  # type: ignore[no-redef]
+        .values(*USER_OUTPUT_FIELDS)
+    )
+
+
 def user_exists(*, email: str) -> bool:
     """
     Check if a user with the given email exists.
@@ -88,4 +143,4 @@ def user_exists(*, email: str) -> bool:
     Returns:
         True if user exists, False otherwise
     """
-    return User.objects.filter(email__iexact=email).exists()
+    return User.objects.filter(email_normalized=email.lower()).exists()
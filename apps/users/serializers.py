@@ -4,12 +4,16 @@ User Serializers - Input/Output schemas for User API.
 Note: Authentication serializers are now in apps.authentication.
 """
 
+from typing import Any
+
 from rest_framework import serializers
 
+from apps.core.serializers import CachedFieldsMixin
+
 from .models import User
 
 
-class UserOutputSerializer(serializers.ModelSerializer):
+class UserOutputSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for User output (responses)."""
 
     full_name = serializers.CharField(read_only=True)
@@ -29,14 +33,33 @@ class UserOutputSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
-class UserUpdateInputSerializer(serializers.Serializer):
+def user_to_dict(user: User) -> dict[str, Any]:
+    """
+    Build the UserOutputSerializer representation with plain attribute reads.
+
+    Used on read-heavy endpoints where DRF's per-field dispatch dominates.
+    Datetimes are left for the JSON renderer to encode.
+    """
+    return {
+        "id": user.id,
+        "email": user.email,
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "full_name": user.full_name,
+        "is_active": user.is_active,
+        "created_at": user.created_at,
+        "updated_at": user.updated_at,
+    }
+
+
+class UserUpdateInputSerializer(CachedFieldsMixin, serializers.Serializer):
     """Serializer for user profile update."""
 
     first_name = serializers.CharField(max_length=150, required=False)
     last_name = serializers.CharField(max_length=150, required=False)
 
 
-class ChangePasswordInputSerializer(serializers.Serializer):
+class ChangePasswordInputSerializer(CachedFieldsMixin, serializers.Serializer):
     """Serializer for authenticated password change."""
 
     current_password = serializers.CharField(
@@ -23,6 +23,9 @@ def user_update(
     """
     Update user profile information.
 
+    Only fields whose value actually changes are written; if nothing
+    changes, no UPDATE is issued.
+
     Args:
         user: The User instance to update
         first_name: Optional new first name
@@ -31,12 +34,17 @@ def user_update(
     Returns:
         The updated User instance
     """
-    if first_name is not None:
+    update_fields = []
+
+    if first_name is not None and first_name != user.first_name:
         user.first_name = first_name
-    if last_name is not None:
+        update_fields.append("first_name")
+    if last_name is not None and last_name != user.last_name:
         user.last_name = last_name
+        update_fields.append("last_name")
 
-    user.save(update_fields=["first_name", "last_name", "updated_at"])
+    if update_fields:
+        user.save(update_fields=[*update_fields, "updated_at"])
     return user
 
 
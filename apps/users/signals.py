@@ -0,0 +1,16 @@
+"""
+User Signals - Keep cached user read models in sync with writes.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import user_list_cache_invalidate
+from .models import User
+
+
+@receiver(post_save, sender=User, dispatch_uid="users_list_cache_on_save")
+@receiver(post_delete, sender=User, dispatch_uid="users_list_cache_on_delete")
+def invalidate_user_list_cache(sender, **kwargs) -> None:
+    """Drop cached user list pages whenever a user changes."""
+    user_list_cache_invalidate()
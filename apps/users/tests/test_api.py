@@ -8,6 +8,9 @@ Note: Authentication endpoints (register, login, change-password) are tested in
 
 import pytest
 from rest_framework import status
+from tests.factories import UserFactory
+
+from apps.core.pagination import DefaultCursorPagination
 
 
 @pytest.mark.django_db
@@ -21,6 +24,17 @@ class TestMeEndpoint:
         assert response.status_code == status.HTTP_200_OK
         assert response.data["email"] == user.email
 
+    def test_patch_me_is_stable_across_requests(self, authenticated_client, user):
+        """Test repeated PATCH responses built from cached serializer fields."""
+        authenticated_client.patch("/api/v1/users/me/", {"first_name": "First"})
+        response = authenticated_client.patch(
+            "/api/v1/users/me/", {"first_name": "Second"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["first_name"] == "Second"
+        assert response.json()["full_name"] == f"Second {user.last_name}"
+
     def test_get_me_requires_auth(self, api_client):
         """Test GET /me requires authentication."""
         response = api_client.get("/api/v1/users/me/")
@@ -65,3 +79,50 @@ class TestChangePasswordEndpoint:
         )
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+class TestUserListEndpoint:
+    """Tests for GET /api/v1/users/"""
+
+    def test_list_returns_active_users(self, authenticated_client, user, other_user):
+        """Test GET /users lists active users with the output fields."""
+        response = authenticated_client.get("/api/v1/users/")
+
+        assert response.status_code == status.HTTP_200_OK
+        emails = {item["email"] for item in response.json()["results"]}
+        assert emails == {user.email, other_user.email}
+        assert response.json()["results"][0]["full_name"]
+
+    def test_list_is_cursor_paginated(
+        self, authenticated_client, user, other_user, monkeypatch
+    ):
+        """Test GET /users pages through results with a cursor."""
+        monkeypatch.setattr(DefaultCursorPagination, "page_size", 1)
+
+        first = authenticated_client.get("/api/v1/users/").json()
+        second = authenticated_client.get(first["next"]).json()
+
+        assert len(first["results"]) == 1
+        assert first["results"][0]["id"] < second["results"][0]["id"]
+        assert second["next"] is None
+
+    def test_list_limits_page_to_default_size(self, authenticated_client, user):
+        """Test GET /users returns at most one page of users."""
+        UserFactory.create_batch_bulk(DefaultCursorPagination.page_size)
+
+        data = authenticated_client.get("/api/v1/users/").json()
+
+        assert len(data["results"]) == DefaultCursorPagination.page_size
+        assert data["next"] is not None
+
+    def test_list_reflects_user_changes(self, authenticated_client, user, other_user):
+        """Test cached list pages are invalidated when a user is saved."""
+        authenticated_client.get("/api/v1/users/")
+
+        other_user.is_active = False
+        other_user.save()
+        response = authenticated_client.get("/api/v1/users/")
+
+        emails = {item["email"] for item in response.json()["results"]}
+        assert emails == {user.email}
@@ -0,0 +1,28 @@
+"""
+Tests for the User model.
+"""
+
+import pytest
+from django.core.exceptions import ValidationError
+
+from apps.users.models import User
+
+
+@pytest.mark.django_db
+class TestUserValidateUnique:
+    """Tests for User.validate_unique."""
+
+    def test_rejects_case_variant_of_existing_email(self, user):
+        """Test a case-only variant fails validation on email."""
+        duplicate = User(email=user.email.upper())
+
+        with pytest.raises(ValidationError) as exc_info:
+            duplicate.validate_unique()
+
+        assert exc_info.value.message_dict["email"] == [
+            "A user with that email already exists."
+        ]
+
+    def test_allows_saved_user_to_revalidate(self, user):
+        """Test an existing user does not collide with itself."""
+        user.validate_unique()
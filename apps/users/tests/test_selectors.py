@@ -6,7 +6,9 @@ These tests validate the read operations for users.
 
 import pytest
 
+from apps.core.request_cache import request_cache_scope
 from apps.users import selectors
+from apps.users.serializers import UserOutputSerializer
 
 
 @pytest.mark.django_db
@@ -52,6 +54,14 @@ class TestUserGetByEmail:
 
         assert result is None
 
+    def test_memoizes_within_request_cache(self, user, django_assert_num_queries):
+        """Test repeated lookups in one request hit the database once."""
+        with request_cache_scope(), django_assert_num_queries(1):
+            first = selectors.user_get_by_email(email=user.email)
+            second = selectors.user_get_by_email(email=user.email.upper())
+
+        assert first is second
+
 
 @pytest.mark.django_db
 class TestUserList:
@@ -98,6 +108,38 @@ class TestUserListActive:
         assert result.first() == user
 
 
+@pytest.mark.django_db
+class TestUserListActiveValues:
+    """Tests for user_list_active_values selector."""
+
+    def test_fields_match_output_serializer(self):
+        """Test row keys stay in sync with UserOutputSerializer."""
+        fields = tuple(UserOutputSerializer.Meta.fields)
+
+        assert fields == selectors.USER_OUTPUT_FIELDS
+
+    def test_returns_output_fields_for_active_users(self, user, other_user):
+        """Test rows carry the output fields, including computed full_name."""
+        other_user.is_active = False
+        other_user.save()
+
+        rows = list(selectors.user_list_active_values())
+
+        assert len(rows) == 1
+        assert rows[0]["email"] == user.email
+        assert rows[0]["full_name"] == user.full_name
+
+    def test_full_name_falls_back_to_email(self, user):
+        """Test full_name is the email when both names are blank."""
+        user.first_name = ""
+        user.last_name = ""
+        user.save()
+
+        row = selectors.user_list_active_values().get()
+
+        assert row["full_name"] == user.email
+
+
 @pytest.mark.django_db
 class TestUserExists:
     """Tests for user_exists selector."""
@@ -113,3 +155,11 @@ class TestUserExists:
     def test_case_insensitive(self, user):
         """Test email check is case insensitive."""
         assert selectors.user_exists(email=user.email.upper()) is True
+
+    def test_matches_mixed_case_stored_email(self, db):
+        """Test lookup matches emails stored with mixed-case local parts."""
+        from apps.users.models import User
+
+        User.objects.create_user(email="Mixed.Case@Example.com", password="x")
+
+        assert selectors.user_exists(email="mixed.case@example.com") is True
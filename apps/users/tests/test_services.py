@@ -47,6 +47,15 @@ class TestUserUpdate:
         assert updated_user.first_name == "NewFirst"
         assert updated_user.last_name == "NewLast"
 
+    def test_skips_save_when_nothing_changes(self, user):
+        """Test an update with unchanged values does not touch the row."""
+        updated_at = user.updated_at
+
+        services.user_update(user=user, first_name=user.first_name)
+
+        user.refresh_from_db()
+        assert user.updated_at == updated_at
+
 
 @pytest.mark.django_db
 class TestUserChangePassword:
@@ -5,17 +5,25 @@ User profile and management endpoints.
 Note: Authentication endpoints are now in apps.authentication.
 """
 
+from typing import cast
+
+from django.core.cache import cache
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.core.pagination import DefaultCursorPagination
+
 from . import selectors, services
+from .cache import USER_LIST_CACHE_TIMEOUT, user_list_cache_key
+from .models import User
 from .serializers import (
     ChangePasswordInputSerializer,
     UserOutputSerializer,
     UserUpdateInputSerializer,
+    user_to_dict,
 )
 
 
@@ -30,8 +38,10 @@ class MeView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request: Request) -> Response:
+        # Hot path: request.user is already loaded, skip serializer machinery.
+        # IsAuthenticated guarantees a real User here.
         return Response(
-            UserOutputSerializer(request.user).data,
+            user_to_dict(cast(User, request.user)),
             status=status.HTTP_200_OK,
         )
 
@@ -79,14 +89,21 @@ class UserListApi(APIView):
     """
     List all active users (admin only in production).
 
-    GET /api/v1/users/
+    GET /api/v1/users/?cursor=<cursor>
     """
 
     permission_classes = [IsAuthenticated]
+    pagination_class = DefaultCursorPagination
 
     def get(self, request: Request) -> Response:
-        users = selectors.user_list_active()
-        return Response(
-            UserOutputSerializer(users, many=True).data,
-            status=status.HTTP_200_OK,
-        )
+        cache_key = user_list_cache_key(url=request.build_absolute_uri())
+        data = cache.get(cache_key)
+
+        if data is None:
+            users = selectors.user_list_active_values()
+            paginator = self.pagination_class()
+            page = paginator.paginate_queryset(users, request, view=self)
+            data = paginator.get_paginated_response(page).data
+            cache.set(cache_key, data, USER_LIST_CACHE_TIMEOUT)
+
+        return Response(data, status=status.HTTP_200_OK)
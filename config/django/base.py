@@ -8,9 +8,9 @@ from config.env import BASE_DIR, env
 # =============================================================================
 # Core Settings
 # =============================================================================
-DEBUG = env("DEBUG", default=False)
+DEBUG = env("DEBUG")
 SECRET_KEY = env("SECRET_KEY")
-ALLOWED_HOSTS = env("ALLOWED_HOSTS", default=[])
+ALLOWED_HOSTS = env("ALLOWED_HOSTS")
 
 # =============================================================================
 # Application Definition
@@ -61,6 +61,7 @@ INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 # =============================================================================
 MIDDLEWARE = [
     "apps.security.middleware.SecurityHeadersMiddleware",
+    "apps.core.middleware.RequestCacheMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -111,12 +112,41 @@ WSGI_APPLICATION = "config.wsgi.application"
 DATABASES = {
     "default": env.db("DATABASE_URL", default="sqlite:///db.sqlite3"),
 }
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+
+# Reuse connections instead of opening one per request. Daphne (ASGI) does
+# not keep thread-local connections across requests, so PostgreSQL uses
+# psycopg's pool (incompatible with CONN_MAX_AGE); other backends persist.
+if DATABASES["default"]["ENGINE"] == "django.db.backends.postgresql" and env(
+    "DATABASE_POOL"
+):
+    DATABASES["default"].setdefault("OPTIONS", {})["pool"] = True
+else:
+    DATABASES["default"]["CONN_MAX_AGE"] = env("CONN_MAX_AGE")
+
+# =============================================================================
+# Cache (Redis; separate DB from Celery and Channels)
+# =============================================================================
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": env("CACHE_URL", default="redis://redis:6379/2"),
+    },
+}
 
 # =============================================================================
 # Authentication
 # =============================================================================
 AUTH_USER_MODEL = "users.User"
 
+# Tuned Argon2 first; the others only verify (and upgrade) existing hashes
+PASSWORD_HASHERS = [
+    "apps.security.hashers.TunedArgon2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"
@@ -125,7 +155,7 @@ AUTH_PASSWORD_VALIDATORS = [
         "NAME": "django.contrib.auth.password_validation.MinimumLengthValidator",
         "OPTIONS": {"min_length": 12},
     },
-    {"NAME": "django.contrib.auth.password_validation.CommonPasswordValidator"},
+    {"NAME": "apps.security.validators.BloomCommonPasswordValidator"},
     {"NAME": "django.contrib.auth.password_validation.NumericPasswordValidator"},
     {"NAME": "apps.security.validators.PasswordStrengthValidator"},
     {"NAME": "apps.security.validators.BreachCheckValidator"},
@@ -174,14 +204,22 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # =============================================================================
 # Third-Party Settings (imported from config/settings/)
 # =============================================================================
-from config.settings.allauth import *  # noqa: F401, F403, E402
-from config.settings.celery import *  # noqa: F401, F403, E402
-from config.settings.channels import *  # noqa: F401, F403, E402
-from config.settings.cors import *  # noqa: F401, F403, E402
-from config.settings.email import *  # noqa: F401, F403, E402
-from config.settings.guardian import *  # noqa: F401, F403, E402
-from config.settings.jwt import *  # noqa: F401, F403, E402
-from config.settings.rest_framework import *  # noqa: F401, F403, E402
-from config.settings.security import *  # noqa: F401, F403, E402
-from config.settings.tailwind import *  # noqa: F401, F403, E402
-from config.settings.unfold import *  # noqa: F401, F403, E402
+# Production images bundle these into one module (`manage.py build_settings`);
+# keep this list in sync with config.settings.SETTINGS_MODULES.
+try:
+    from config.settings._compiled import *  # noqa: F401, F403, E402
+except ModuleNotFoundError as e:
+    # Only a missing bundle falls back; errors inside it must surface
+    if e.name != "config.settings._compiled":
+        raise
+    from config.settings.allauth import *  # noqa: F401, F403, E402
+    from config.settings.celery import *  # noqa: F401, F403, E402
+    from config.settings.channels import *  # noqa: F401, F403, E402
+    from config.settings.cors import *  # noqa: F401, F403, E402
+    from config.settings.email import *  # noqa: F401, F403, E402
+    from config.settings.guardian import *  # noqa: F401, F403, E402
+    from config.settings.jwt import *  # noqa: F401, F403, E402
+    from config.settings.rest_framework import *  # noqa: F401, F403, E402
+    from config.settings.security import *  # noqa: F401, F403, E402
+    from config.settings.tailwind import *  # noqa: F401, F403, E402
+    from config.settings.unfold import *  # noqa: F401, F403, E402
@@ -2,6 +2,8 @@
 Local development settings.
 """
 
+from config.settings.logging import build_logging
+
 from .base import *  # noqa: F401, F403
 
 # =============================================================================
@@ -29,35 +31,4 @@ EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 # =============================================================================
 # Logging
 # =============================================================================
-LOGGING = {
-    "version": 1,
-    "disable_existing_loggers": False,
-    "formatters": {
-        "verbose": {
-            "format": "{levelname} {asctime} {module} {message}",
-            "style": "{",
-        },
-    },
-    "handlers": {
-        "console": {
-            "class": "logging.StreamHandler",
-            "formatter": "verbose",
-        },
-    },
-    "root": {
-        "handlers": ["console"],
-        "level": "INFO",
-    },
-    "loggers": {
-        "django": {
-            "handlers": ["console"],
-            "level": "INFO",
-            "propagate": False,
-        },
-        "apps": {
-            "handlers": ["console"],
-            "level": "DEBUG",
-            "propagate": False,
-        },
-    },
-}
+LOGGING = build_logging(level="INFO", apps_level="DEBUG", formatter="verbose")
@@ -3,14 +3,16 @@ Production settings - Secure defaults for deployment.
 """
 
 from config.env import env
+from config.settings.logging import build_logging
 
 from .base import *  # noqa: F401, F403
+from .base import DATABASES
 
 # =============================================================================
 # Security Settings
 # =============================================================================
 DEBUG = False
-SECURE_SSL_REDIRECT = env.bool("SECURE_SSL_REDIRECT", default=True)
+SECURE_SSL_REDIRECT = env("SECURE_SSL_REDIRECT")
 SESSION_COOKIE_SECURE = True
 CSRF_COOKIE_SECURE = True
 SECURE_BROWSER_XSS_FILTER = True
@@ -20,44 +22,32 @@ SECURE_HSTS_SECONDS = 31536000
 SECURE_HSTS_INCLUDE_SUBDOMAINS = True
 SECURE_HSTS_PRELOAD = True
 
+# =============================================================================
+# Database
+# =============================================================================
+# Prepared statements: with server-side binding, psycopg prepares a query once
+# it has run prepare_threshold times on a connection and reuses its plan.
+# Django passes prepare_threshold=None (never prepare) unless it is set here.
+# Connection reuse comes from base.py: on PostgreSQL that is the psycopg pool,
+# which keeps prepared statements across requests (CONN_MAX_AGE is not used).
+# Behind PgBouncer in transaction mode, set DATABASE_SERVER_SIDE_BINDING=False:
+# prepared statements live on one server connection and break there.
+if DATABASES["default"]["ENGINE"] == "django.db.backends.postgresql":
+    DATABASES["default"].setdefault("OPTIONS", {}).update(
+        server_side_binding=env("DATABASE_SERVER_SIDE_BINDING"),
+        prepare_threshold=env("DATABASE_PREPARE_THRESHOLD"),
+    )
+
 # =============================================================================
 # CSRF Trusted Origins
 # =============================================================================
-CSRF_TRUSTED_ORIGINS = env.list("CSRF_TRUSTED_ORIGINS", default=[])
+CSRF_TRUSTED_ORIGINS = env("CSRF_TRUSTED_ORIGINS")
 
 # =============================================================================
 # Logging
 # =============================================================================
-LOGGING = {
-    "version": 1,
-    "disable_existing_loggers": False,
-    "formatters": {
-        "json": {
-            "()": "django.utils.log.ServerFormatter",
-            "format": "[{server_time}] {message}",
-            "style": "{",
-        },
-    },
-    "handlers": {
-        "console": {
-            "class": "logging.StreamHandler",
-            "formatter": "json",
-        },
-    },
-    "root": {
-        "handlers": ["console"],
-        "level": "WARNING",
-    },
-    "loggers": {
-        "django": {
-            "handlers": ["console"],
-            "level": "WARNING",
-            "propagate": False,
-        },
-        "apps": {
-            "handlers": ["console"],
-            "level": "INFO",
-            "propagate": False,
-        },
-    },
-}
+# Records are formatted on the calling thread and written to stderr by the
+# listener thread in config/logging.py
+LOGGING = build_logging(
+    level="WARNING", apps_level="INFO", formatter="json", queued=True
+)
@@ -25,6 +25,20 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": ":memory:",
+        # Journal and fsync already stay in memory for an in-memory database;
+        # keep sort/temp b-trees there too instead of spilling to temp files
+        "OPTIONS": {
+            "init_command": "PRAGMA temp_store=MEMORY;",
+        },
+    },
+}
+
+# =============================================================================
+# Local-Memory Cache
+# =============================================================================
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
     },
 }
 
@@ -7,9 +7,43 @@ import environ
 BASE_DIR = pathlib.Path(__file__).parent.parent
 APPS_DIR = BASE_DIR / "apps"
 
-env = environ.Env()
+# Cast and default for every bool/int/list setting read from the environment.
+# Call sites read these with a plain env("NAME") and no default=, so this
+# scheme is the single source of truth. String and URL settings keep their
+# defaults inline at the call site.
+env = environ.Env(
+    # config/env.py
+    READ_DOT_ENV_FILE=(bool, True),
+    # config/django/base.py
+    DEBUG=(bool, False),
+    ALLOWED_HOSTS=(list, []),
+    DATABASE_POOL=(bool, True),
+    CONN_MAX_AGE=(int, 600),
+    # config/django/production.py
+    SECURE_SSL_REDIRECT=(bool, True),
+    DATABASE_SERVER_SIDE_BINDING=(bool, True),
+    DATABASE_PREPARE_THRESHOLD=(int, 5),
+    CSRF_TRUSTED_ORIGINS=(list, []),
+    # config/settings/cors.py
+    CORS_ALLOWED_ORIGINS=(list, []),
+    CORS_ALLOW_ALL_ORIGINS=(bool, False),
+    CORS_ALLOW_CREDENTIALS=(bool, True),
+    # config/settings/email.py
+    EMAIL_PORT=(int, 25),
+    EMAIL_USE_TLS=(bool, False),
+    # config/settings/jwt.py
+    ACCESS_TOKEN_LIFETIME_MINUTES=(int, 60),
+    REFRESH_TOKEN_LIFETIME_DAYS=(int, 7),
+    # config/settings/security.py
+    SECURITY_HEADERS_ENABLED=(bool, True),
+    SECURITY_HSTS_SECONDS=(int, 31536000),
+    ADMIN_IP_RESTRICTION_ENABLED=(bool, True),
+    PASSWORD_BREACH_CHECK_ENABLED=(bool, True),
+    PASSWORD_BREACH_THRESHOLD=(int, 1),
+    SESSION_INACTIVITY_TIMEOUT=(int, 604800),
+)
 
-READ_DOT_ENV_FILE = env.bool("READ_DOT_ENV_FILE", default=True)
+READ_DOT_ENV_FILE = env("READ_DOT_ENV_FILE")
 
 if READ_DOT_ENV_FILE:
     environ.Env.read_env(BASE_DIR / ".env")
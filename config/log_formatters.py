@@ -0,0 +1,33 @@
+"""
+Log formatters for production.
+"""
+
+import logging
+
+import orjson
+
+__all__ = ("OrjsonFormatter",)
+
+
+class OrjsonFormatter(logging.Formatter):
+    """
+    Format records as one-line JSON objects with a fixed set of keys.
+
+    Keys: ts (epoch seconds), lvl, logger, mod, msg, plus exc with the
+    formatted traceback when the record carries exception info.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": record.created,
+            "lvl": record.levelname,
+            "logger": record.name,
+            "mod": record.module,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exc"] = record.exc_text
+
+        return orjson.dumps(payload).decode()
@@ -0,0 +1,69 @@
+"""
+Queued log output for production.
+
+Request threads only enqueue records via logging.handlers.QueueHandler; a
+background listener writes them to stderr through a 64 KiB buffer that is
+flushed whenever the queue runs empty, so bursts of records share one write.
+"""
+
+import atexit
+import io
+import logging
+import os
+import queue
+import sys
+from logging.handlers import QueueListener
+
+__all__ = ("LOG_BUFFER_SIZE", "log_queue", "listener")
+
+LOG_BUFFER_SIZE = 64 * 1024
+
+log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler that leaves flushing to the listener."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class DrainFlushingQueueListener(QueueListener):
+    """QueueListener that flushes its handlers whenever the queue drains."""
+
+    def __init__(
+        self, log_queue: queue.Queue[logging.LogRecord], *handlers: logging.Handler
+    ) -> None:
+        super().__init__(log_queue, *handlers)
+        self._log_queue = log_queue
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        if block and self._log_queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+        return self._log_queue.get(block)
+
+    def stop(self) -> None:
+        super().stop()
+        for handler in self.handlers:
+            handler.flush()
+
+
+def _buffered_stderr() -> io.TextIOWrapper:
+    """Open a buffered text stream on a duplicate of the stderr descriptor."""
+    raw = os.fdopen(os.dup(sys.stderr.fileno()), "wb", buffering=LOG_BUFFER_SIZE)
+    return io.TextIOWrapper(
+        raw, encoding="utf-8", errors="backslashreplace", write_through=False
+    )
+
+
+listener = DrainFlushingQueueListener(
+    log_queue, BufferedStreamHandler(_buffered_stderr())
+)
+listener.start()
+atexit.register(listener.stop)
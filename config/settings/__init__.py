@@ -1 +1,17 @@
 """Third-party settings package."""
+
+# Modules star-imported by config.django.base, in import order.
+# `manage.py build_settings` bundles them into _compiled.py.
+SETTINGS_MODULES = (
+    "allauth",
+    "celery",
+    "channels",
+    "cors",
+    "email",
+    "guardian",
+    "jwt",
+    "rest_framework",
+    "security",
+    "tailwind",
+    "unfold",
+)
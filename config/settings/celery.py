@@ -13,9 +13,12 @@ CELERY_RESULT_BACKEND = env("CELERY_RESULT_BACKEND", default="redis://redis:6379
 # =============================================================================
 # Task Serialization
 # =============================================================================
-CELERY_TASK_SERIALIZER = "json"
-CELERY_RESULT_SERIALIZER = "json"
-CELERY_ACCEPT_CONTENT = ["json"]
+# msgpack is smaller on the wire and faster to encode than JSON. Unlike
+# kombu's JSON serializer it does not encode datetimes/UUIDs: pass them to
+# tasks as strings. JSON stays accepted for messages already queued.
+CELERY_TASK_SERIALIZER = "msgpack"
+CELERY_RESULT_SERIALIZER = "msgpack"
+CELERY_ACCEPT_CONTENT = ["msgpack", "json"]
 CELERY_TIMEZONE = "UTC"
 
 # =============================================================================
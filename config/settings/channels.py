@@ -19,7 +19,19 @@ CHANNEL_LAYERS = {
     "default": {
         "BACKEND": "channels_redis.core.RedisChannelLayer",
         "CONFIG": {
-            "hosts": [CHANNEL_LAYERS_URL],
+            # Extra host keys are passed to the per-event-loop Redis
+            # connection pool. Pool size is left unbounded: redis-py's pool
+            # raises "Too many connections" at the cap instead of waiting.
+            "hosts": [
+                {
+                    "address": CHANNEL_LAYERS_URL,
+                    "socket_keepalive": True,
+                },
+            ],
+            # Messages buffered per channel before ChannelFull is raised
+            "capacity": 1500,
+            # Seconds an undelivered message is kept
+            "expiry": 10,
         },
     },
 }
@@ -9,26 +9,29 @@ from config.env import env
 # =============================================================================
 
 # Allow all origins in development, restrict in production
-CORS_ALLOWED_ORIGINS = env.list("CORS_ALLOWED_ORIGINS", default=[])
+CORS_ALLOWED_ORIGINS = env("CORS_ALLOWED_ORIGINS")
 
 # Allow all origins (use only in development)
-CORS_ALLOW_ALL_ORIGINS = env("CORS_ALLOW_ALL_ORIGINS", default=False)
+CORS_ALLOW_ALL_ORIGINS = env("CORS_ALLOW_ALL_ORIGINS")
 
 # Allow credentials (cookies, authorization headers)
-CORS_ALLOW_CREDENTIALS = env("CORS_ALLOW_CREDENTIALS", default=True)
+CORS_ALLOW_CREDENTIALS = env("CORS_ALLOW_CREDENTIALS")
+
+# Immutable tuples: django-cors-headers joins these into preflight response
+# headers, and its system checks require a sequence (not a set)
 
 # Allowed HTTP methods
-CORS_ALLOW_METHODS = [
+CORS_ALLOW_METHODS = (
     "DELETE",
     "GET",
     "OPTIONS",
     "PATCH",
     "POST",
     "PUT",
-]
+)
 
 # Allowed headers
-CORS_ALLOW_HEADERS = [
+CORS_ALLOW_HEADERS = (
     "accept",
     "accept-encoding",
     "authorization",
@@ -38,12 +41,10 @@ CORS_ALLOW_HEADERS = [
     "user-agent",
     "x-csrftoken",
     "x-requested-with",
-]
+)
 
 # Expose headers to frontend
-CORS_EXPOSE_HEADERS = [
-    "content-disposition",
-]
+CORS_EXPOSE_HEADERS = ("content-disposition",)
 
 # Preflight cache duration (in seconds)
 CORS_PREFLIGHT_MAX_AGE = 86400  # 24 hours
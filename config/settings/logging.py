@@ -0,0 +1,66 @@
+"""
+Logging configuration builder shared by the environment settings.
+"""
+
+from typing import Any
+
+FORMATTERS = {
+    "verbose": {
+        "format": "{levelname} {asctime} {module} {message}",
+        "style": "{",
+    },
+    "json": {
+        "()": "config.log_formatters.OrjsonFormatter",
+    },
+}
+
+
+def build_logging(
+    *,
+    level: str,
+    apps_level: str,
+    formatter: str,
+    queued: bool = False,
+) -> dict[str, Any]:
+    """
+    Build a LOGGING dict with a single console handler on the root logger.
+
+    A fresh dict is returned on every call: dictConfig mutates the config it
+    is given, so the result must not be shared or cached.
+
+    Args:
+        level: Level for the root and django loggers
+        apps_level: Level for the project's "apps" logger
+        formatter: Key in FORMATTERS used by the console handler
+        queued: Hand records to the background writer in config/logging.py
+            instead of writing to stderr on the calling thread
+
+    Returns:
+        Logging configuration for dictConfig
+    """
+    if queued:
+        console = {
+            "()": "logging.handlers.QueueHandler",
+            "queue": "ext://config.logging.log_queue",
+        }
+    else:
+        console = {"class": "logging.StreamHandler"}
+    console["formatter"] = formatter
+
+    return {
+        "version": 1,
+        "disable_existing_loggers": False,
+        "formatters": {formatter: dict(FORMATTERS[formatter])},
+        "handlers": {"console": console},
+        "root": {
+            "handlers": ["console"],
+            "level": level,
+        },
+        # Only root has a handler; named loggers just set levels and
+        # propagate. Listing "django" also drops the handlers Django's
+        # DEFAULT_LOGGING attaches to it, so records are not emitted twice.
+        "loggers": {
+            "django": {"level": level},
+            "apps": {"level": apps_level},
+        },
+    }
@@ -7,7 +7,7 @@ from config.env import env
 # =============================================================================
 # Security Headers
 # =============================================================================
-SECURITY_HEADERS_ENABLED = env("SECURITY_HEADERS_ENABLED", default=True)
+SECURITY_HEADERS_ENABLED = env("SECURITY_HEADERS_ENABLED")
 
 # Content Security Policy - customize based on your app's needs
 SECURITY_CSP_POLICY = env(
@@ -27,26 +27,26 @@ SECURITY_CSP_POLICY = env(
 
 # HSTS - Only applies to HTTPS requests
 # 31536000 = 1 year (recommended for production)
-SECURITY_HSTS_SECONDS = env("SECURITY_HSTS_SECONDS", default=31536000)
+SECURITY_HSTS_SECONDS = env("SECURITY_HSTS_SECONDS")
 
 # =============================================================================
 # Admin IP Restriction
 # =============================================================================
-ADMIN_IP_RESTRICTION_ENABLED = env("ADMIN_IP_RESTRICTION_ENABLED", default=True)
+ADMIN_IP_RESTRICTION_ENABLED = env("ADMIN_IP_RESTRICTION_ENABLED")
 ADMIN_URL_PREFIX = "/admin/"
 
 # =============================================================================
 # Password Breach Check
 # =============================================================================
 # Enable/disable Have I Been Pwned API check
-PASSWORD_BREACH_CHECK_ENABLED = env("PASSWORD_BREACH_CHECK_ENABLED", default=True)
+PASSWORD_BREACH_CHECK_ENABLED = env("PASSWORD_BREACH_CHECK_ENABLED")
 
 # Minimum breach count to reject password (1 = reject any breached password)
-PASSWORD_BREACH_THRESHOLD = env("PASSWORD_BREACH_THRESHOLD", default=1)
+PASSWORD_BREACH_THRESHOLD = env("PASSWORD_BREACH_THRESHOLD")
 
 # =============================================================================
 # Session Management
 # =============================================================================
 # Cleanup sessions inactive for more than this duration (in seconds)
 # 7 days = 604800 seconds
-SESSION_INACTIVITY_TIMEOUT = env("SESSION_INACTIVITY_TIMEOUT", default=604800)
+SESSION_INACTIVITY_TIMEOUT = env("SESSION_INACTIVITY_TIMEOUT")
@@ -3,8 +3,15 @@ Django Unfold Admin Configuration.
 https://unfoldadmin.com/docs/
 """
 
+import functools
+
 from django.templatetags.static import static
-from django.urls import reverse_lazy
+from django.urls import reverse
+from django.utils.functional import lazy
+
+# Admin URL names are fixed once the URLconf loads; resolve each one on first
+# use and reuse the string on every sidebar render afterwards.
+_admin_url = lazy(functools.cache(reverse), str)
 
 UNFOLD = {
     "SITE_TITLE": "Django Velocity",
@@ -45,12 +52,12 @@ UNFOLD = {
                     {
                         "title": "Users",
                         "icon": "person",
-                        "link": reverse_lazy("admin:users_user_changelist"),
+                        "link": _admin_url("admin:users_user_changelist"),
                     },
                     {
                         "title": "Groups",
                         "icon": "group",
-                        "link": reverse_lazy("admin:auth_group_changelist"),
+                        "link": _admin_url("admin:auth_group_changelist"),
                     },
                 ],
             },
@@ -7,15 +7,23 @@ from django.urls import include, path
 
 from apps.core.health import HealthCheckView, health_check_simple
 
+api_v1_patterns = [
+    path(f"{prefix}/", include(urlconf))
+    for prefix, urlconf in (
+        ("auth", "apps.authentication.urls"),
+        ("users", "apps.users.urls"),
+        ("permissions", "apps.permissions.urls"),
+        ("security", "apps.security.urls"),
+    )
+]
+
 urlpatterns = [
     # Health checks (before any auth middleware)
     path("health/", HealthCheckView.as_view(), name="health_check"),
     path("health/live/", health_check_simple, name="health_check_simple"),
     # Admin
     path("admin/", admin.site.urls),
-    # API v1 - DRF endpoints
-    path("api/v1/auth/", include("apps.authentication.urls")),
-    path("api/v1/users/", include("apps.users.urls")),
-    path("api/v1/permissions/", include("apps.permissions.urls")),
-    path("api/v1/security/", include("apps.security.urls")),
+    # API v1 - DRF endpoints, behind one prefix so non-API paths are
+    # rejected after a single match attempt
+    path("api/v1/", include(api_v1_patterns)),
 ]
@@ -1,14 +1,28 @@
 """
 Project-wide pytest configuration and fixtures.
+
+Test settings (config.django.test) already use the MD5 password hasher.
+User fixtures go one step further and store passwords hashed once per
+session, so creating a fixture user never runs the hasher.
 """
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from rest_framework.test import APIClient
 
+from tests.factories import hashed_password
+
 User = get_user_model()
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Isolate tests from each other's cached data."""
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 def api_client() -> APIClient:
     """Unauthenticated API client."""
@@ -18,9 +32,9 @@ def api_client() -> APIClient:
 @pytest.fixture
 def user(db) -> User:
     """Create a regular test user."""
-    return User.objects.create_user(
+    return User.objects.create(
         email="test@example.com",
-        password="testpass123",
+        password=hashed_password("testpass123"),
         first_name="Test",
         last_name="User",
     )
@@ -29,9 +43,9 @@ def user(db) -> User:
 @pytest.fixture
 def other_user(db) -> User:
     """Create another test user."""
-    return User.objects.create_user(
+    return User.objects.create(
         email="other@example.com",
-        password="testpass123",
+        password=hashed_password("testpass123"),
         first_name="Other",
         last_name="User",
     )
@@ -40,9 +54,11 @@ def other_user(db) -> User:
 @pytest.fixture
 def admin_user(db) -> User:
     """Create a superuser for admin tests."""
-    return User.objects.create_superuser(
+    return User.objects.create(
         email="admin@example.com",
-        password="adminpass123",
+        password=hashed_password("adminpass123"),
+        is_staff=True,
+        is_superuser=True,
     )
 
 
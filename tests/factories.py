@@ -7,13 +7,23 @@ Usage:
     def test_something():
         user = UserFactory()  # Creates a user in DB
         user = UserFactory.build()  # Creates a user without saving
+        users = UserFactory.create_batch_bulk(100)  # One INSERT for many users
 """
 
+import functools
+
 import factory
+from django.contrib.auth.hashers import make_password
 
 from apps.users.models import User
 
 
+@functools.cache
+def hashed_password(raw_password: str) -> str:
+    """Hash each distinct factory password once per test session."""
+    return make_password(raw_password)
+
+
 class UserFactory(factory.django.DjangoModelFactory):
     """
     Factory for creating User instances in tests.
@@ -21,10 +31,10 @@ class UserFactory(factory.django.DjangoModelFactory):
 
     class Meta:
         model = User
-        skip_postgeneration_save = True
 
     email = factory.Sequence(lambda n: f"user{n}@example.com")
-    password = factory.PostGenerationMethodCall("set_password", "testpass123")
+    # Raw passwords (default or passed in) are stored pre-hashed
+    password = factory.Transformer("testpass123", transform=hashed_password)
     first_name = factory.Faker("first_name")
     last_name = factory.Faker("last_name")
     is_active = True
@@ -32,15 +42,17 @@ class UserFactory(factory.django.DjangoModelFactory):
     is_superuser = False
 
     @classmethod
-    def _create(cls, model_class, *args, **kwargs):
+    def create_batch_bulk(cls, size: int, **kwargs) -> list[User]:
         """
-        Override the default _create method to use create_user for proper password hashing.
+        Create `size` users with bulk INSERTs instead of one query per user.
+
+        bulk_create() bypasses User.save() and post_save signals, so
+        email_normalized is set here.
         """
-        password = kwargs.pop("password", "testpass123")
-        obj = super()._create(model_class, *args, **kwargs)
-        obj.set_password(password)
-        obj.save()
-        return obj
+        users = cls.build_batch(size, **kwargs)
+        for user in users:
+            user.email_normalized = user.email.lower()
+        return User.objects.bulk_create(users, batch_size=500)
 
 
 class AdminUserFactory(UserFactory):